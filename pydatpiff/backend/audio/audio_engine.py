@@ -16,34 +16,39 @@ class Popen(subprocess.Popen):  # pragma: no cover
 
     def __init__(self, *args, **kwargs):
         """build subprocess Popen object"""
+        # Player commands are written to stdin. Output is never read, so discard it
+        # rather than letting it fill a pipe and block the player.
         kwargs["stdin"] = subprocess.PIPE
-        kwargs["stdout"] = subprocess.PIPE
-        kwargs["stderr"] = subprocess.PIPE
+        kwargs["stdout"] = subprocess.DEVNULL
+        kwargs["stderr"] = subprocess.DEVNULL
         atexit.register(self.kill_on_quit)
         try:
             super().__init__(shell=False, *args, **kwargs)
             self._player_PID = self.pid
-        except:
+        except Exception as e:
             logger.exception("PlayerPopenFailed")
             # throws PlayerNotFoundError
-            raise PlayerError(6)
+            raise PlayerError(6) from e
 
     def stop_player(self):
+        pid = str(self._player_PID)
         if platform.system() == "Windows":
             # https://tweaks.com/windows/39559/kill-processes-from-command-prompt/
-            kill_cmd = ("taskkill /pid {} /F",)
+            kill_cmd = ["taskkill", "/pid", pid, "/F"]
         else:
             # Systems: Linux, Darwin ..etc
-            kill_cmd = "kill -9 {}"
+            kill_cmd = ["kill", "-9", pid]
 
         try:  # For Linux device, Mac, Ubuntu, Debain...etc
             if self._player_PID:
+                # run the kill command directly, without spawning a shell
                 return subprocess.check_call(
-                    kill_cmd.format(self._player_PID),
-                    shell=True,
-                    stderr=subprocess.PIPE,
+                    kill_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                 )
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, OSError):
+            # kill command failed or is not installed (e.g minimal container without procps)
             return os.kill(int(self._player_PID), 9)  # kill mpv using os
         except:
             logger.exception("Failed to kill player")
@@ -58,13 +63,11 @@ class Popen(subprocess.Popen):  # pragma: no cover
         """
         self.registered_popen.append(self)
 
-        # constantly probe Popen to check if player is running
-        while True:
-            if self.poll() is not None:
-                if callback:
-                    callback(*args, **kwargs)
-                self.kill()
-                break
+        # block until the player process exits
+        self.wait()
+        if callback:
+            callback(*args, **kwargs)
+        self.kill()
 
     @classmethod
     def unregister(cls):
@@ -81,7 +84,3 @@ class Popen(subprocess.Popen):  # pragma: no cover
     def kill_on_quit(self):
         if self.is_alive:
             self.stop_player()
-
-    def kill_on_start(self):
-        for process in self.registered_popen:
-            process.kill()
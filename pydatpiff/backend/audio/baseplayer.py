@@ -1,6 +1,6 @@
-import re
+from time import sleep
 
-from mutagen.mp3 import MP3
+from mutagen.mp3 import MPEGInfo
 
 from pydatpiff.constants import music_symbols, player_state_keys
 from pydatpiff.errors import PlayerError
@@ -75,6 +75,8 @@ class BasePlayer(metaclass=BaseMeta):
     _state = dict((k, False) for k in player_state_keys)
 
     def __init__(self, *args, **kwargs):
+        # each player keeps its own state rather than sharing the class default
+        self._state = dict.fromkeys(player_state_keys, False)
         self._track_loaded = False
         self._track_playing = False
         self._track_paused = False
@@ -87,10 +89,14 @@ class BasePlayer(metaclass=BaseMeta):
 
     def reset_and_update_state(self, update=None):
         """Reset and update  all player's state"""
-        self._state.update(playing=False, paused=False, loaded=False, stopped=False)
+        state = self._state
+        state["playing"] = False
+        state["paused"] = False
+        state["loaded"] = False
+        state["stopped"] = False
         #  update state if specified.
-        update = update if update else {}
-        self._state.update(**update)
+        if update:
+            state.update(update)
 
     @property
     def name(self):
@@ -114,17 +120,17 @@ class BasePlayer(metaclass=BaseMeta):
     @property
     def _track_loaded(self):
         """Return player loaded state"""
-        return self.state["loaded"]
+        return self._state["loaded"]
 
     @_track_loaded.setter
     def _track_loaded(self, state=False):
-        self.state["loaded"] = bool(state)
+        self._state["loaded"] = bool(state)
 
     @property
     def _track_playing(self):
         """Return the track playing state"""
         # if boolean param not specified, then return the playing state
-        return self.state["playing"]
+        return self._state["playing"]
 
     @_track_playing.setter
     def _track_playing(self, state=False):
@@ -135,35 +141,36 @@ class BasePlayer(metaclass=BaseMeta):
                 True: sets playing True and pause to False.
                 False: sets playing False and pause True.
         """
-        self.state["playing"] = state
+        self._state["playing"] = state
 
     @property
     def _track_paused(self):
-        return self.state["paused"]
+        return self._state["paused"]
 
     @_track_paused.setter
     def _track_paused(self, state=False):
-        self.state["paused"] = bool(state)
+        self._state["paused"] = bool(state)
 
     @property
     def _track_stopped(self):
-        return self.state["paused"]
+        return self._state["paused"]
 
     @_track_stopped.setter
     def _track_stopped(self, state=False):
-        self.state["stopped"] = bool(state)
+        self._state["stopped"] = bool(state)
 
     @property
     def _system_stopped(self):
-        return self.state["paused"]
+        return self._state["paused"]
 
     @_system_stopped.setter
     def _system_stopped(self, state=False):
-        self.state["system_stopped"] = bool(state)
+        self._state["system_stopped"] = bool(state)
 
     @threader_wrapper
     def auto_manage_state(self, *args, **kwargs):
         DEBOUNCE_TIME = 1000 * 2  # two seconds
+        POLL_INTERVAL = 0.05  # 20Hz is plenty to detect when a track has finished
         state = dict(
             loaded=False,
             playing=False,
@@ -172,34 +179,42 @@ class BasePlayer(metaclass=BaseMeta):
             system_stopped=False,
         )
         while True:
+            # Read the track's duration on every tick, since the track may be changed
+            # (see: set_track) while this thread is still running.
+            duration = self.duration
+            # read the track clock once per tick
+            current_time = self.current_time
 
             # Handle system stop
             # Automatically stop track - mainly used for media.autoplay feature.
-            if self.current_time > 0 and self.current_time >= (self.duration - DEBOUNCE_TIME):
+            if current_time > 0 and current_time >= (duration - DEBOUNCE_TIME):
                 self.stop
-                state.update(dict(stopped=False, system_stopped=True))
+                state["stopped"] = False
+                state["system_stopped"] = True
 
             if self._track_loaded and not self._track_playing:
-                if self.current_time > 0:
-                    state.update(dict(loaded=True, paused=True))
-                else:
-                    state.update(dict(loaded=True))
+                state["loaded"] = True
+                if current_time > 0:
+                    state["paused"] = True
 
             elif self._track_playing:
-                state.update(dict(loaded=True, playing=True))
+                state["loaded"] = True
+                state["playing"] = True
 
             elif self._track_paused:
-                state.update(dict(loaded=True, paused=True))
+                state["loaded"] = True
+                state["paused"] = True
 
             elif self._track_stopped:
                 self.stop
                 self._paused_time = 0
                 self._track_start_time = 0
-                state.update(dict(system_stopped=True))
+                state["system_stopped"] = True
 
             self.state = state
             if self.state.get("stopped", True):
                 break
+            sleep(POLL_INTERVAL)
 
     def set_track(self, *args, **kwargs):
         # Media class method needed on all player
@@ -213,33 +228,20 @@ class BasePlayer(metaclass=BaseMeta):
         """Format current song time to clock format"""
         raise NotImplementedError
 
+    def _sync_state(self):
+        """Update the player's state from the media player's own state manager, if it has one"""
+        pass
+
     @property
     def info(self):
         """Current state of the song"""
         if not hasattr(self, "_song") or not hasattr(self, "current_time"):
             return "no song loaded"
 
-        if "vlc" in str(self.__class__.__name__).lower():
-            # VLC player has its own state manager
-            state = re.match(r"[\w.]*\.(\w*)", str(self._player.get_state())).group(1)
-        else:
-            state = self._state
+        # Players that have their own state manager (e.g VLC) update the player's state here.
+        self._sync_state()
 
         symbol = "[]"
-        if isinstance(state, str) and state != "NothingSpecial":
-            # convert state's str to key/value pairs.
-            # On initialization, set all state values => False
-            vlc_state = state.lower()
-            # Reset state
-            for k, v in self._state.items():
-                self._state[k] = False
-
-            # See vlc.get_state docs for more info on VLC states
-            self._state["playing"] = "playing" in vlc_state
-            self._state["paused"] = "paused" in vlc_state
-            self._state["stopped"] = "ended" in state.lower() or "error" in vlc_state or "stopped" in vlc_state
-            self._state["system_stopped"] = "error" in vlc_state
-
         """
         NOTE: we don't want to reset all state, we only want to update the state and its opposing state
         e.g: playing: True -> paused: False
@@ -266,9 +268,9 @@ class BasePlayer(metaclass=BaseMeta):
         # song duration
         duration_min, duration_sec = self._format_time(self.duration)
 
-        current_sec = str(current_sec).zfill(2)
-        duration_sec = str(duration_sec).zfill(2)
-        track_info = "{0}  {1}:{2} - {3}:{4}\n".format(symbol, current_min, current_sec, duration_min, duration_sec)
+        track_info = "{0}  {1}:{2:02d} - {3}:{4:02d}\n".format(
+            symbol, current_min, current_sec, duration_min, duration_sec
+        )
 
         is_auto_playing = getattr(self, "_media_autoplay", False)
         autoplay_symbol = music_symbols["autoplay"] if is_auto_playing else ""
@@ -304,10 +306,6 @@ class BasePlayer(metaclass=BaseMeta):
         """Play media song"""
         raise NotImplementedError
 
-    @play.setter
-    def play(self, *args, **kwargs):
-        raise NotImplementedError
-
     @property
     def pause(self):
         """Pause the media song"""
@@ -337,9 +335,12 @@ class BasePlayer(metaclass=BaseMeta):
         raise NotImplementedError
 
 
-class MetaData(MP3):
+class MetaData:
     def __init__(self, track):
-        super().__init__(track)
+        # Only the MPEG stream header (and Xing/VBRI header) is needed for the duration.
+        # MPEGInfo seeks past the ID3 tags without parsing them.
+        with open(track, "rb") as f:
+            self.info = MPEGInfo(f)
 
     @property
     def track_duration(self):
@@ -1,23 +1,22 @@
-import re
+import logging
 from functools import wraps
-from time import sleep, time
+from time import time
 
 from pydatpiff.errors import MvpError
 from pydatpiff.frontend.screen import Verbose
 from pydatpiff.utils.filehandler import File
 
-from ...utils.utils import threader_wrapper
 from .audio_engine import Popen
 from .baseplayer import BasePlayer, MetaData
 
+logger = logging.getLogger(__name__)
 
-class MPV(BasePlayer):
-    # 10 mins:  Time to kill inattentive threads see pause.
-    # Save the user's CPU :-)
-    _MAX_INACTIVITY = 60 * 10
 
+class MPV(BasePlayer):
     def __init__(self):
         self.time_captured = None
+        self._pause_started = None
+        self._duration = 0
         self._song_path = None
         self._song = None
         self._popen = None
@@ -37,39 +36,34 @@ class MPV(BasePlayer):
             "%s" % song,
         ]
 
-    @threader_wrapper
     def _handle_pause_event(self):
         """
-        Captures the time duration when the track is paused.
-        Once track is unpause time will be added back to the original track time
+        Captures the time when the track is paused.
+        See MPV._handle_unpause_event.
+        """
+        self._pause_started = time()
+
+    def _handle_unpause_event(self):
+        """
+        Add the time the track spent paused back to the original track time.
         This time will be used to calculate the accuracy of current_position
         when pause state changes from pause to playing.
         """
-        rollback = 0
-        while True:
-            rollback += 1
-            if not self._track_paused or self._track_playing:
-                self._track_start_time += rollback
-                return
-            sleep(1)  # must use sleep to prevent high cpu usage while threading
-
-            if rollback > self._MAX_INACTIVITY:
-                Verbose('Pydatpiff program was killed due to "Pause Inactivity"...')
-                exit(1)
+        if self._pause_started is None:
+            return
+        self._track_start_time += time() - self._pause_started
+        self._pause_started = None
 
     @property
     def duration(self):
         """Return track length  in seconds"""
-        if hasattr(self, "_metadata"):
-            return self._metadata.track_duration
-        return 0
+        # track length is read once from the track's metadata. See: set_track
+        return self._duration
 
     def _format_time(self, pos=None):
         """Format current song time to clock format"""
         pos = self.duration if not pos else pos
-        minutes = int(pos / 60)
-        seconds = int(pos % 60)
-        return minutes, seconds
+        return divmod(int(pos), 60)
 
     @property
     def current_time(self):
@@ -135,7 +129,7 @@ class MPV(BasePlayer):
         :param: pos - time to rewind or fast-forward (in seconds)
         """
 
-        raw_sec = re.sub(r"-", "", str(sec))
+        raw_sec = str(sec).replace("-", "")
         if not raw_sec.isnumeric():
             Verbose("Must use numerical numbers")
             return
@@ -150,8 +144,10 @@ class MPV(BasePlayer):
             self._song = name
             self._song_path = path
             self._metadata = MetaData(path)
+            self._duration = self._metadata.track_duration
             self._track_loaded = True
             self._track_start_time = time()
+            self._pause_started = None
             self._volume = self._global_volume
             self.auto_manage_state()
         else:
@@ -181,7 +177,6 @@ class MPV(BasePlayer):
             self._popen.register()
             self._track_loaded = True
             self._track_playing = True
-            self.play  # noqa  - this is a property function in baseplayer
             self._volume = self._global_volume
 
     @property
@@ -196,9 +191,10 @@ class MPV(BasePlayer):
                 self._track_paused = True
                 self._handle_pause_event()
             else:
-                Verbose("\nUnpause")
+                logger.debug("Unpause")
                 self._track_paused = False
                 self._track_playing = True
+                self._handle_unpause_event()
                 cmd = "set pause no \n"
                 self._write_cmd(cmd)
         else:
@@ -1,41 +1,143 @@
-import vlc
+import threading
+from functools import lru_cache
 
+from pydatpiff.constants import player_state_keys
 from pydatpiff.errors import PlayerError
 from pydatpiff.frontend.screen import Verbose
 
 from .baseplayer import BasePlayer
 
+# python-vlc loads libvlc as soon as it is imported,
+# so it is only imported once a VLCPlayer is created. See: _import_vlc
+vlc = None
+
+
+def _state_flags(**flags):
+    """Player's state with only the given flags set. See: BasePlayer.state"""
+    state = dict.fromkeys(player_state_keys, False)
+    state.update(flags)
+    return state
+
+
+def _import_vlc():
+    """Import python-vlc, once"""
+    global vlc
+    if vlc is None:
+        import vlc as python_vlc
+
+        vlc = python_vlc
+    return vlc
+
+
+@lru_cache(maxsize=None)
+def _vlc_states():
+    """
+    Build the libvlc state tables, once python-vlc is imported.
+
+    :return: (state_flags, finished_states, event_states)
+        state_flags - player's state for each libvlc media player state. See: vlc.State
+            NothingSpecial is left out, since it does not change the player's state.
+        finished_states - libvlc states in which the current track is no longer playable
+        event_states - libvlc state reported by each libvlc player event
+    """
+    _import_vlc()
+    State, EventType = vlc.State, vlc.EventType
+    state_flags = {
+        State.Opening: _state_flags(),
+        State.Buffering: _state_flags(),
+        State.Playing: _state_flags(playing=True),
+        State.Paused: _state_flags(paused=True),
+        State.Stopped: _state_flags(stopped=True),
+        State.Ended: _state_flags(stopped=True),
+        State.Error: _state_flags(stopped=True, system_stopped=True),
+    }
+    finished_states = (State.Stopped, State.Ended, State.Error)
+    event_states = {
+        EventType.MediaPlayerNothingSpecial: State.NothingSpecial,
+        EventType.MediaPlayerOpening: State.Opening,
+        EventType.MediaPlayerPlaying: State.Playing,
+        EventType.MediaPlayerPaused: State.Paused,
+        EventType.MediaPlayerStopped: State.Stopped,
+        EventType.MediaPlayerEndReached: State.Ended,
+        EventType.MediaPlayerEncounteredError: State.Error,
+    }
+    return state_flags, finished_states, event_states
+
 
 class VLCPlayer(BasePlayer):
+    # Seconds to collect more volume and seek changes (e.g key repeat) before applying them.
+    _VOLUME_DEBOUNCE = 0.05
+    _SEEK_DEBOUNCE = 0.03
+
     def __init__(self, *args, **kwargs):
         try:
+            self._libvlc_state_flags, self._finished_states, event_states = _vlc_states()
             self._vlc = vlc.Instance("-q")
             self._player = self._vlc.media_player_new()
-        except:
+        except Exception as e:
             extended_msg = "Please check if your device supports VLC"
-            raise PlayerError(1, extended_msg)
+            raise PlayerError(1, extended_msg) from e
+
+        # bind libvlc player methods once, since they are called on every player action
+        player = self._player
+        self._player_play = player.play
+        self._player_pause = player.pause
+        self._player_stop = player.stop
+        self._get_time = player.get_time
+        self._set_time = player.set_time
+        self._get_length = player.get_length
+        self._get_volume = player.audio_get_volume
+        self._set_volume = player.audio_set_volume
+
+        # Track state is pushed by libvlc's state events rather than requested from libvlc
+        # on every access. See: VLCPlayer._on_state_changed
+        self._cur_state = vlc.State.NothingSpecial
+        event_manager = player.event_manager()
+        for event_type, state in event_states.items():
+            event_manager.event_attach(event_type, self._on_state_changed, state)
+
+        # pending volume_up/volume_down changes. See: VLCPlayer._queue_volume_change
+        self._volume_lock = threading.Lock()
+        self._pending_volume_delta = 0
+        self._volume_timer = None
+
+        # pending rewind/ffwd changes. See: VLCPlayer._seeker
+        self._seek_lock = threading.Lock()
+        self._pending_seek_ms = 0
+        self._seek_timer = None
 
         self._volume = self._global_volume
         super().__init__(*args, **kwargs)
 
+    def _on_state_changed(self, event, state):
+        # libvlc is not reentrant, so event handlers must not call libvlc functions
+        self._cur_state = state
+
     @property
     def duration(self):
-        return self._player.get_length()
+        return self._get_length()
 
     def _format_time(self, pos=None):
         """Format current song time to clock format"""
-        mins = int(pos / 60000)
-        secs = int((pos % 60000) / 1000)
-        return mins, secs
+        # vlc time is in milliseconds
+        mins, millis = divmod(pos, 60000)
+        return mins, millis // 1000
 
     @property
     def current_time(self):
-        return self._player.get_time()
+        return self._get_time()
+
+    def _sync_state(self):
+        """Update the player's state from libvlc's state"""
+        flags = self._libvlc_state_flags.get(self._cur_state)
+        if flags is not None:
+            self._state.update(flags)
 
     def set_track(self, name, path=None):
         if path:
             self._song = name
             self._path = path
+            self._cur_state = vlc.State.NothingSpecial
             self._player.set_mrl(path)
             self._volume = self._global_volume
             self.auto_manage_state()
@@ -45,56 +147,74 @@ class VLCPlayer(BasePlayer):
     @property
     def _volume(self):
         """Get current media player volume"""
-        return self._player.audio_get_volume()
+        return self._get_volume()
 
     @_volume.setter
     def _volume(self, level):
         """Set media player volume"""
-        if level < 0:
-            level = 0
-        if level > 100:
-            level = 100
-
-        self._player.audio_set_volume(level)
+        level = max(0, min(100, level))
+        self._set_volume(level)
         self._global_volume = level
 
+    def _queue_volume_change(self, delta):
+        """
+        Coalesce a burst of volume changes into a single libvlc volume update.
+        The accumulated change is applied _VOLUME_DEBOUNCE seconds after the first change of a burst.
+        """
+        with self._volume_lock:
+            self._pending_volume_delta += delta
+            if self._volume_timer is None:
+                self._volume_timer = threading.Timer(self._VOLUME_DEBOUNCE, self._flush_volume)
+                self._volume_timer.daemon = True
+                self._volume_timer.start()
+
+    def _flush_volume(self):
+        """Apply the pending volume change. See: VLCPlayer._queue_volume_change"""
+        # the volume is set while holding the lock, so an exact volume always wins over an earlier burst
+        with self._volume_lock:
+            delta = self._pending_volume_delta
+            self._pending_volume_delta = 0
+            self._volume_timer = None
+            if delta:
+                self._volume += delta
+
     def volume_up(self, level=5):
         """Turn the media volume up"""
-        if not level and not isinstance(level, int):
+        if not isinstance(level, int):
             return
-        self._volume += level
+        self._queue_volume_change(level)
 
     def volume_down(self, level=5):
         """Turn the media volume down"""
-        if not level and not isinstance(level, int):
+        if not isinstance(level, int):
             return
-        self._volume -= level
+        self._queue_volume_change(-level)
 
     def volume(self, level):
         """Set the volume to exact number"""
         if not level or not isinstance(level, int):
             return
-        self._volume = level
+        # an exact volume overrides any pending volume_up/volume_down changes
+        with self._volume_lock:
+            self._pending_volume_delta = 0
+            self._volume = level
 
     @property
     def play(self):
         """Play media song"""
-        if not self._track_stopped:
-            if self._track_paused:
-                # unpause if track is already playing but paused
-                self.pause
-            else:
-                self._player.play()
-
-            self._track_playing = True
-        else:
-            try:
-                self.stop
-                self.set_track(self._song, self._path)
-                self.state["stopped"] = False
-                return self.play
-            except RecursionError:
-                self.state["stopped"] = True
+        # state is kept up to date by libvlc's events. See: VLCPlayer._on_state_changed
+        state = self._cur_state
+        if state == vlc.State.Paused:
+            # unpause if track is already playing but paused
+            self.pause
+        elif state != vlc.State.Playing:
+            if state in self._finished_states:
+                # a finished track has to be reloaded before libvlc can play it again
+                self._player.set_mrl(self._path)
+            self._player_play()
+
+        self._track_playing = True
+        self.state["stopped"] = False
 
     @property
     def pause(self):
@@ -102,39 +222,59 @@ class VLCPlayer(BasePlayer):
 
         is_paused = self._track_paused
         self._track_playing = is_paused
-        self._player.pause()
+        self._player_pause()
         self._track_paused = not is_paused
 
-    def _seeker(self, pos=10, rew=True):
+    def _seeker(self, offset_ms: int):
+        """
+        Coalesce a burst of rewinds and fast-forwards into a single libvlc seek.
+        The accumulated offset is applied _SEEK_DEBOUNCE seconds after the first seek of a burst.
+
+        :param: offset_ms - signed time to seek (in milliseconds). Negative values rewind.
+        """
         if self._state["stopped"]:
             return
-        if rew:
-            to_position = self._player.get_time() - (pos * 1000)
-            # seeking far before track starts
-            if to_position < 0:
-                to_position = 0
-        else:
-            to_position = self._player.get_time() + (pos * 1000)
-            # seeking too far beyond track ends
-            if to_position > self.duration:
-                to_position = self.duration - 1
+        with self._seek_lock:
+            self._pending_seek_ms += offset_ms
+            if self._seek_timer is None:
+                self._seek_timer = threading.Timer(self._SEEK_DEBOUNCE, self._flush_seek)
+                self._seek_timer.daemon = True
+                self._seek_timer.start()
+
+    def _flush_seek(self):
+        """Apply the pending seek offset. See: VLCPlayer._seeker"""
+        with self._seek_lock:
+            offset = self._pending_seek_ms
+            self._pending_seek_ms = 0
+            self._seek_timer = None
+        if not offset:
+            return
+
+        to_position = self._get_time() + offset
+        duration = self.duration
+        # seeking far before track starts
+        if to_position < 0:
+            to_position = 0
+        # seeking too far beyond track ends (once libvlc has reported the track's length)
+        elif duration and to_position > duration:
+            to_position = duration - 1
 
-        self._player.set_time(to_position)
+        self._set_time(to_position)
 
-    def rewind(self, pos=10):
+    def rewind(self, pos: int = 10):
         """Rewind track
-        @params: pos:: time(second) to rewind media. default:10(sec)
+        @params: pos:: (int) time(second) to rewind media. default:10(sec)
         """
-        self._seeker(pos, True)
+        self._seeker(-pos * 1000)
 
-    def ffwd(self, pos=10):
+    def ffwd(self, pos: int = 10):
         """Fast forward track
         vlc time is in milliseconds
-        @params: pos:: time(second) to rewind media. default:10(sec)
+        @params: pos:: (int) time(second) to fast-forward media. default:10(sec)
         """
-        self._seeker(pos, False)
+        self._seeker(pos * 1000)
 
     @property
     def stop(self):
-        self._player.stop()
+        self._player_stop()
         self._track_stopped = True
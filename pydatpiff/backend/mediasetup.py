@@ -8,6 +8,10 @@ from pydatpiff.utils.utils import Object
 
 from .scraper import MediaScraper
 
+# Album's name from Datpiff's embedded player page
+_ALBUM_TITLE_RE = re.compile(r"class=\"title\">(.*)<")
+_WHITESPACE_RE = re.compile(r"\s")
+
 
 class DatpiffPlayer:
     """
@@ -27,14 +31,7 @@ class DatpiffPlayer:
 
     def _verify_version(self):
         try:
-            self.name = (
-                re.search(
-                    r"class=\"title\">(.*)<",
-                    self.embedded_player_content,
-                )
-                .group(1)
-                .strip()
-            )
+            self.name = _ALBUM_TITLE_RE.search(self.embedded_player_content).group(1).strip()
         except AttributeError:
             raise Mp3Error(3, "Could not find album's name")
         return self.name
@@ -45,11 +42,14 @@ class DatpiffPlayer:
         # Note: Request Sessions are being cached for every request.
         #      If the url endpoint is found in the cached, the request
         #      will NOT be recalled.  Instead, the cached response will be returned.
-        url = self.build_web_player_url(self._album_ID)
-        try:
-            return self._session.method("GET", url).text
-        except:  # noqa
-            raise DatpiffError(1, SERVER_DOWN_MSG)
+        #      The decoded text is also kept on the instance, since name, bio and Mp3 all read it.
+        if not hasattr(self, "_embedded_player_text"):
+            url = self.build_web_player_url(self._album_ID)
+            try:
+                self._embedded_player_text = self._session.method("GET", url).text
+            except:  # noqa
+                raise DatpiffError(1, SERVER_DOWN_MSG)
+        return self._embedded_player_text
 
     def _check_datpiff_version(self):
         """
@@ -141,10 +141,10 @@ class Album(DatpiffPlayer):
         """
         # Session responses are cached,
         # so we don't have to worry about recalling requests.
-        response = self._session.method("GET", self.link)
-        if response:
-            return response.text
-        return " "
+        if not hasattr(self, "_album_html_text"):
+            response = self._session.method("GET", self.link)
+            self._album_html_text = response.text if response else " "
+        return self._album_html_text
 
     @property
     def uploader(self):
@@ -163,9 +163,9 @@ class Album(DatpiffPlayer):
         index, link = links
         album = cls(link)
         tracks = Mp3(album).songs
+        song = Object.strip_and_lower(song)
         for track in tracks:
-            song = Object.strip_and_lower(song)
-            if song in Object.strip_and_lower(track):
+            if song in track.lower().strip():
                 return {"index": index, "album": album.name, "song": track}
 
 
@@ -177,6 +177,12 @@ class Mp3:
         self.album = album
         self.album_response = album.embedded_player_content
 
+        # scraped from album_response on first access
+        self._songs = None
+        self._urlencoded_tracks = None
+        self._album_id_number = None
+        self._mp3_urls = None
+
     def __len__(self):
         if self.songs:
             return len(self.songs)
@@ -190,22 +196,31 @@ class Mp3:
     @property
     def songs(self):
         """Returns all songs name from album."""
-        return MediaScraper.get_song_titles(self.album_response)
+        if self._songs is None:
+            self._songs = MediaScraper.get_song_titles(self.album_response)
+        return self._songs
 
     @property
     def __urlencoded_tracks(self):
         """Url encode audio url"""
-        songs = MediaScraper.get_mp3_urls(self.album_response)
-        return [re.sub(r"\s", "%20", song) for song in songs]
+        if self._urlencoded_tracks is None:
+            songs = MediaScraper.get_mp3_urls(self.album_response)
+            self._urlencoded_tracks = [_WHITESPACE_RE.sub("%20", song) for song in songs]
+        return self._urlencoded_tracks
 
     @property
     def _album_id(self):
         """Media Album reference ID number Ex: 6/m1393dba"""
-        return MediaScraper.get_embed_player_id(self.album_response)
+        if self._album_id_number is None:
+            self._album_id_number = MediaScraper.get_embed_player_id(self.album_response)
+        return self._album_id_number
 
     @property
     def mp3_urls(self):
-        url = "https://hw-mp3.datpiff.com/mixtapes/"
-        for track in self.__urlencoded_tracks:
-            endpoint = "{}{}".format(self._album_id, track)
-            yield "".join((url, endpoint))
+        """Returns all mp3 urls from album."""
+        if self._mp3_urls is None:
+            album_id = self._album_id
+            self._mp3_urls = [
+                f"https://hw-mp3.datpiff.com/mixtapes/{album_id}{track}" for track in self.__urlencoded_tracks
+            ]
+        return self._mp3_urls
@@ -1,6 +1,5 @@
 import logging
 import re
-from functools import wraps
 
 import bs4
 
@@ -11,6 +10,15 @@ from pydatpiff.utils.request import Session
 
 logger = logging.getLogger(__name__)
 
+# MediaScraper's patterns. Compiled once, since they run for every album.
+_UPLOADER_NAME_RE = re.compile(r'<a.*href="/profile.*>(.*)</a>')
+_UPLOADER_BIO_RE = re.compile(r'og:description".*content\="(.*)"')
+_ALBUM_SUFFIX_NUMBER_RE = re.compile(r"\.(\d*)\.html")
+_EMBED_PLAYER_ID_RE = re.compile(r"/mixtapes/([\w\/]*)")
+_SONG_TITLES_RE = re.compile(r'"title":"(.*\w*)",\s?"artist"')
+_DURATION_RE = re.compile(r'"duration">(.*\d*)<')
+_MP3_URLS_RE = re.compile(r"fix.concat\(\s\'(.*\w*)\'")
+
 
 def escape_html_characters(char_list):
     results = []
@@ -189,24 +197,11 @@ class MixtapeScraper:
 
 
 class MediaScraper:
-    @staticmethod
-    def wrapper(f):
-        @wraps(f)
-        def inner(obj):
-            try:
-                f(obj)
-            except:
-                raise AttributeError("Regex Error")
-            else:
-                return f(obj)
-
-        return inner
-
     @staticmethod
     def get_uploader_name(string):
         """Return the name of the person whom upload the mixtape"""
         try:
-            return re.search(r'<a.*href="/profile.*>(.*)</a>', string).group(1)
+            return _UPLOADER_NAME_RE.search(string).group(1)
         except AttributeError:
             pass
         return ""
@@ -214,7 +209,7 @@ class MediaScraper:
     @staticmethod
     def get_uploader_bio(string):
         try:
-            desc = re.findall(r'og:description".*content\="(.*)"', string)
+            desc = _UPLOADER_BIO_RE.findall(string)
             if desc:
                 return escape_html_characters(desc[-1])[0].strip()
         except AttributeError:
@@ -223,24 +218,24 @@ class MediaScraper:
 
     @staticmethod
     def get_album_suffix_number(string):
-        return re.search(r"\.(\d*)\.html", string).group(1)
+        return _ALBUM_SUFFIX_NUMBER_RE.search(string).group(1)
 
     @staticmethod
     def get_embed_player_id(text):
-        return re.search(r"/mixtapes/([\w\/]*)", text).group(1)  # noqa
+        return _EMBED_PLAYER_ID_RE.search(text).group(1)
 
     @classmethod
     def get_song_titles(cls, text):
-        songs = re.findall(r'"title":"(.*\w*)",\s?"artist"', text)
+        songs = _SONG_TITLES_RE.findall(text)
         songs = list(escape_html_characters(songs))
         return songs
 
     @classmethod
     def get_duration_from(cls, text):
-        return re.findall(r'"duration">(.*\d*)<', text)
+        return _DURATION_RE.findall(text)
 
     def get_mp3_urls(text):
         try:
-            return re.findall(r"fix.concat\(\s\'(.*\w*)\'", text)  # noqa
+            return _MP3_URLS_RE.findall(text)
         except AttributeError:
             raise Mp3Error(4)
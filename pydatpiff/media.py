@@ -48,6 +48,7 @@ class Media:
         self._artist_name = None
         self._album_name = None
         self._selected_song = None
+        self._written_track = None  # (album url, song, demo) currently stored in the temp file
         self.__cache_storage = {}
         self.AUTOPLAY_INACTIVITY_TIME = 60 * 5  # 5 minutes
 
@@ -173,7 +174,8 @@ class Media:
         Verbose("\n" + verbose_message["SEARCH_SONG"] % song_name)
         links = self.mixtape.links
         links = list(enumerate(links, start=1))
-        results = ThreadQueue(Album.lookup_song, links).execute(song=song_name)
+        # album lookups are network bound, so overlap as many requests as we reasonably can.
+        results = ThreadQueue(Album.lookup_song, links, max_workers=16).execute(song=song_name)
         if not results:
             Verbose(verbose_message["SONG_NAME_NOT_FOUND"] % song_name)
         results = Object.remove_list_null_value(results)
@@ -235,6 +237,7 @@ class Media:
     @property
     def mp3_urls(self):
         """Returns all parsed mp3 url"""
+        # copy, so callers cannot change Mp3's cached urls. See: Media._write_audio
         return list(self._Mp3.mp3_urls)
 
     def show_songs(self):
@@ -446,17 +449,23 @@ class Media:
         else:  # demo partial song
             buffer = int(buffer_size / 5)
             start = int(buffer / 5)
-            chunk = content[start : buffer + start]
+            # slice a view of the content, so the demo chunk is not copied before writing
+            chunk = memoryview(content)[start : buffer + start]
         size = File.get_human_readable_file_size(buffer)
 
-        # write song to file
-        File.write_to_file(self.__temp_file.name, chunk, mode="wb")
+        # write song to file, unless the temp file already holds this exact track.
+        # The temp file may have been removed by another Media. See: Tmp.remove_temp_file_on_startup
+        written_track = (self.url, song_name, demo)
+        temp_file = self.__temp_file.name
+        if written_track != self._written_track or not File.is_file(temp_file):
+            File.write_to_file(temp_file, chunk, mode="wb")
+            self._written_track = written_track
 
         # display message to user
         screen.display_play_message(self.artist, self.album, song_name, size, demo)
 
         song = " - ".join((self.artist, song_name))
-        self.player.set_track(song, self.__temp_file.name)
+        self.player.set_track(song, temp_file)
         self.player.play  # noqa - play song is a property of the player class
 
     def download(self, track=None, rename=None, output=None):
@@ -41,6 +41,9 @@ class Tmp(object):  # pragma: no cover
 
 
 class File:
+    # size of each write when writing binary content, e.g. mp3 audio
+    _WRITE_CHUNK_SIZE = 1024 * 1024
+
     @staticmethod
     def is_dir(path):
         path = path or ""
@@ -64,7 +67,15 @@ class File:
     @classmethod
     def write_to_file(cls, filename, content, mode="wb"):
         with open(filename, mode) as f:
-            f.write(content)
+            if "b" not in mode:
+                f.write(content)
+                return
+
+            # Write binary content in chunks of the same buffer,
+            # rather than handing one large write to the filesystem.
+            view = memoryview(content)
+            for start in range(0, len(view), cls._WRITE_CHUNK_SIZE):
+                f.write(view[start : start + cls._WRITE_CHUNK_SIZE])
 
     @staticmethod
     def get_human_readable_file_size(buf_size):
@@ -22,15 +22,17 @@ def threader_wrapper(f):
 
 
 class ThreadQueue:  # pragma: no cover
-    def __init__(self, main_job, input_work: Union[Tuple, List], *args, **kwargs):
+    def __init__(self, main_job, input_work: Union[Tuple, List], *args, max_workers: int = 3, **kwargs):
         """
         This class will be used to execute concurrent jobs.
         The main job will be executed with the input work.
         The input work will be a list of work to be executed.
         :param input_work: input work to perform the main job with.
+        :param max_workers: maximum number of threads used to execute the jobs.
         """
         self.main_job = main_job  # job to perform with work
         self.input_work = input_work
+        self.max_workers = max_workers
 
     def execute(self, *args, **kwargs):
         """
@@ -40,7 +42,7 @@ class ThreadQueue:  # pragma: no cover
         :param kwargs: kwargs to pass to the main job.
 
         """
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             if args or kwargs:
                 data = executor.map(
                     lambda work: self.main_job(work, *args, **kwargs), [work for work in self.input_work], timeout=10
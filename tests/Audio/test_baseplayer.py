@@ -0,0 +1,112 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydatpiff.backend.audio import baseplayer
+from pydatpiff.backend.audio.baseplayer import BasePlayer, MetaData
+from tests.utils import PATH
+
+
+class StopLoop(Exception):
+    """Raised to end BasePlayer.auto_manage_state's loop"""
+
+
+class FakePlayer(BasePlayer):
+    """Player with a settable track clock (in milliseconds)"""
+
+    def __init__(self, duration=0, current_time=0):
+        super().__init__()
+        self._duration = duration
+        self._current_time = current_time
+        self.stop_calls = 0
+
+    def set_track(self, name, path=None):
+        self._song = name
+
+    @property
+    def duration(self):
+        return self._duration
+
+    @property
+    def current_time(self):
+        return self._current_time
+
+    def _format_time(self, pos=None):
+        mins, millis = divmod(pos, 60000)
+        return mins, millis // 1000
+
+    def _seeker(self, offset_ms=0):
+        pass
+
+    def volume(self, level=None):
+        pass
+
+    def volume_up(self, level=5):
+        pass
+
+    def volume_down(self, level=5):
+        pass
+
+    @property
+    def play(self):
+        self._track_playing = True
+
+    @property
+    def pause(self):
+        self._track_paused = True
+
+    def rewind(self, pos=10):
+        pass
+
+    def ffwd(self, pos=10):
+        pass
+
+    @property
+    def stop(self):
+        self.stop_calls += 1
+
+
+class TestAutoManageState(TestCase):
+    def run_auto_manage_state(self, player, on_tick, ticks):
+        """Run auto_manage_state in this thread, calling `on_tick` after each of its first ticks"""
+        count = []
+
+        def sleep(interval):
+            count.append(interval)
+            if len(count) > ticks:
+                raise StopLoop
+            on_tick(len(count))
+
+        with patch.object(baseplayer, "sleep", side_effect=sleep):
+            with self.assertRaises(StopLoop):
+                BasePlayer.auto_manage_state.__wrapped__(player)
+
+    def test_track_is_stopped_before_it_ends(self):
+        player = FakePlayer(duration=10000, current_time=1000)
+
+        def on_tick(tick):
+            player._current_time = 9000
+
+        self.run_auto_manage_state(player, on_tick, ticks=1)
+        self.assertEqual(player.stop_calls, 1)
+
+    def test_changing_track_uses_the_new_track_duration(self):
+        # track A is 10 seconds long
+        player = FakePlayer(duration=10000, current_time=1000)
+
+        def on_tick(tick):
+            # switch to track B (100 seconds), 9 seconds in, while the thread is still running
+            player.set_track("track B")
+            player._duration = 100000
+            player._current_time = 9000
+
+        self.run_auto_manage_state(player, on_tick, ticks=3)
+        self.assertEqual(player.stop_calls, 0)
+
+
+class TestMetaData(TestCase):
+    def test_track_duration_matches_mutagen_mp3_length(self):
+        from mutagen.mp3 import MP3
+
+        track = os.path.join(PATH, "fixtures", "test_song.mp3")
+        self.assertEqual(MetaData(track).track_duration, MP3(track).info.length)
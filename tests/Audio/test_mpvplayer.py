@@ -0,0 +1,41 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydatpiff.backend.audio import mpvplayer
+from pydatpiff.backend.audio.mpvplayer import MPV
+
+
+class TestMPVPause(TestCase):
+    def setUp(self):
+        self.player = MPV()
+        self.player._track_start_time = 100.0
+
+    @patch.object(mpvplayer, "time", autospec=True)
+    def test_unpause_moves_track_start_time_by_the_paused_interval(self, mocked_time):
+        mocked_time.return_value = 130.0
+        self.player._handle_pause_event()
+
+        mocked_time.return_value = 142.5
+        self.player._handle_unpause_event()
+
+        self.assertEqual(self.player._track_start_time, 112.5)
+        self.assertIsNone(self.player._pause_started)
+
+    @patch.object(mpvplayer, "time", autospec=True)
+    def test_unpause_without_a_prior_pause_keeps_track_start_time(self, mocked_time):
+        mocked_time.return_value = 142.5
+        self.player._handle_unpause_event()
+
+        self.assertEqual(self.player._track_start_time, 100.0)
+
+    @patch.object(mpvplayer, "time", autospec=True)
+    def test_a_pause_is_only_accounted_once(self, mocked_time):
+        mocked_time.return_value = 130.0
+        self.player._handle_pause_event()
+        mocked_time.return_value = 140.0
+        self.player._handle_unpause_event()
+
+        mocked_time.return_value = 150.0
+        self.player._handle_unpause_event()
+
+        self.assertEqual(self.player._track_start_time, 110.0)
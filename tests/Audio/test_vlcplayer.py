@@ -0,0 +1,233 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+from pydatpiff.backend.audio import baseplayer, vlcplayer
+from pydatpiff.constants import player_state_keys
+
+
+def fake_libvlc_player():
+    """libvlc media player that keeps the volume it is set to"""
+    player = Mock()
+    volume = {"level": 0}
+    player.audio_get_volume.side_effect = lambda: volume["level"]
+    player.audio_set_volume.side_effect = lambda level: volume.update(level=level)
+    player.get_time.return_value = 0
+    player.get_length.return_value = 0
+    return player
+
+
+class BaseVLCPlayerTest(TestCase):
+    def setUp(self):
+        vlcplayer._vlc_states()
+        self.libvlc_player = fake_libvlc_player()
+        patcher = patch.object(vlcplayer.vlc, "Instance", autospec=True)
+        self.addCleanup(patcher.stop)
+        instance = patcher.start()
+        instance.return_value.media_player_new.return_value = self.libvlc_player
+
+        self.player = vlcplayer.VLCPlayer()
+        self.libvlc_player.reset_mock()
+
+
+class TestVLCPlayerVolume(BaseVLCPlayerTest):
+    def setUp(self):
+        super().setUp()
+        self.player.volume(80)
+        self.libvlc_player.audio_set_volume.reset_mock()
+
+    def wait_for_volume_change(self):
+        timer = self.player._volume_timer
+        if timer is not None:
+            timer.join()
+
+    def test_burst_of_volume_up_sets_the_summed_volume_once(self):
+        self.player.volume_up(5)
+        self.player.volume_up(5)
+        self.player.volume_up(3)
+        self.wait_for_volume_change()
+
+        self.libvlc_player.audio_set_volume.assert_called_once_with(93)
+
+    def test_burst_of_volume_changes_is_clamped(self):
+        for _ in range(5):
+            self.player.volume_up(5)
+        self.wait_for_volume_change()
+        self.libvlc_player.audio_set_volume.assert_called_once_with(100)
+
+        self.libvlc_player.audio_set_volume.reset_mock()
+        for _ in range(30):
+            self.player.volume_down(5)
+        self.wait_for_volume_change()
+        self.libvlc_player.audio_set_volume.assert_called_once_with(0)
+
+    def test_volume_discards_pending_volume_changes(self):
+        timer = None
+        for _ in range(3):
+            self.player.volume_up(5)
+            timer = self.player._volume_timer
+        self.player.volume(40)
+        timer.join()
+
+        self.libvlc_player.audio_set_volume.assert_called_once_with(40)
+        self.assertEqual(self.player._volume, 40)
+
+    def test_volume_wins_over_a_volume_change_being_applied(self):
+        self.player.volume_up(5)
+        self.player._volume_timer.cancel()
+
+        get_volume = self.libvlc_player.audio_get_volume.side_effect
+        set_exact_volume = threading.Thread(target=self.player.volume, args=(40,))
+
+        def get_volume_while_volume_is_set():
+            # set an exact volume while the pending change is being applied
+            if set_exact_volume.ident is None:
+                set_exact_volume.start()
+                set_exact_volume.join(0.1)
+            return get_volume()
+
+        self.libvlc_player.audio_get_volume.side_effect = get_volume_while_volume_is_set
+        self.player._flush_volume()
+        set_exact_volume.join()
+
+        self.assertEqual(self.libvlc_player.audio_set_volume.call_args, call(40))
+
+
+class TestVLCPlayerTime(BaseVLCPlayerTest):
+    def test_track_time_and_length_are_read_from_libvlc(self):
+        self.libvlc_player.get_time.return_value = 5000
+        self.libvlc_player.get_length.return_value = 60000
+
+        self.assertEqual(self.player.current_time, 5000)
+        self.assertEqual(self.player.duration, 60000)
+
+
+class TestVLCPlayerSeek(BaseVLCPlayerTest):
+    def set_track_times(self, time_ms, length_ms):
+        self.libvlc_player.get_time.return_value = time_ms
+        self.libvlc_player.get_length.return_value = length_ms
+
+    def wait_for_seek(self):
+        timer = self.player._seek_timer
+        if timer is not None:
+            timer.join()
+
+    def test_burst_of_ffwd_and_rewind_seeks_once(self):
+        self.set_track_times(5000, 60000)
+        for _ in range(3):
+            self.player.ffwd(10)
+        self.player.rewind(5)
+        self.wait_for_seek()
+
+        self.libvlc_player.set_time.assert_called_once_with(30000)
+
+    def test_seek_is_clamped_to_the_track(self):
+        self.set_track_times(55000, 60000)
+        self.player.ffwd(10)
+        self.player.ffwd(10)
+        self.wait_for_seek()
+        self.libvlc_player.set_time.assert_called_once_with(59999)
+
+        self.libvlc_player.set_time.reset_mock()
+        self.set_track_times(5000, 60000)
+        self.player.rewind(10)
+        self.player.rewind(10)
+        self.wait_for_seek()
+        self.libvlc_player.set_time.assert_called_once_with(0)
+
+    def test_seek_is_not_clamped_to_the_end_before_track_length_is_known(self):
+        self.set_track_times(5000, 0)
+        self.player.ffwd(30)
+        self.wait_for_seek()
+
+        self.libvlc_player.set_time.assert_called_once_with(35000)
+
+
+class TestVLCPlayerPlay(BaseVLCPlayerTest):
+    def setUp(self):
+        super().setUp()
+        self.player._path = "/tmp/song_datpiff"
+
+    def set_libvlc_state(self, state):
+        # libvlc's state change event. See: VLCPlayer._on_state_changed
+        self.player._on_state_changed(None, state)
+
+    def test_play_unpauses_a_paused_track(self):
+        self.set_libvlc_state(vlcplayer.vlc.State.Paused)
+        self.player.play
+
+        self.libvlc_player.pause.assert_called_once_with()
+        self.libvlc_player.play.assert_not_called()
+        self.libvlc_player.set_mrl.assert_not_called()
+
+    def test_play_reloads_and_plays_a_finished_track(self):
+        for state in (vlcplayer.vlc.State.Stopped, vlcplayer.vlc.State.Ended):
+            self.libvlc_player.reset_mock()
+            self.set_libvlc_state(state)
+            self.player.play
+
+            self.libvlc_player.set_mrl.assert_called_once_with(self.player._path)
+            self.libvlc_player.play.assert_called_once_with()
+            self.assertFalse(self.player.state["stopped"])
+
+    def test_play_plays_a_newly_loaded_track_without_reloading_it(self):
+        self.set_libvlc_state(vlcplayer.vlc.State.NothingSpecial)
+        self.player.play
+
+        self.libvlc_player.play.assert_called_once_with()
+        self.libvlc_player.set_mrl.assert_not_called()
+
+    def test_play_does_nothing_when_track_is_playing(self):
+        self.set_libvlc_state(vlcplayer.vlc.State.Playing)
+        self.player.play
+
+        self.libvlc_player.play.assert_not_called()
+        self.libvlc_player.pause.assert_not_called()
+
+
+def state(**flags):
+    """Player's state with only the given flags set"""
+    player_state = dict.fromkeys(player_state_keys, False)
+    player_state.update(flags)
+    return player_state
+
+
+# player's state before libvlc's state changes, which no libvlc state produces
+INITIAL_STATE = state(loaded=True, playing=True, system_stopped=True)
+
+# libvlc state: (player's state after _sync_state, player's state after info)
+EXPECTED_STATES = {
+    "NothingSpecial": (INITIAL_STATE, INITIAL_STATE),
+    "Opening": (state(), state()),
+    "Buffering": (state(), state()),
+    "Playing": (state(playing=True), state(playing=True)),
+    "Paused": (state(paused=True), state(paused=True)),
+    "Stopped": (state(stopped=True), state()),
+    "Ended": (state(stopped=True), state()),
+    "Error": (state(stopped=True, system_stopped=True), state(system_stopped=True)),
+}
+
+
+class TestVLCPlayerInfo(BaseVLCPlayerTest):
+    def new_player(self, libvlc_state):
+        """Player with a loaded song, when libvlc is in `libvlc_state`"""
+        player = vlcplayer.VLCPlayer()
+        player._song = "song"
+        player._state.update(INITIAL_STATE)
+        player._on_state_changed(None, getattr(vlcplayer.vlc.State, libvlc_state))
+        return player
+
+    def test_sync_state_sets_the_player_state_of_each_libvlc_state(self):
+        for libvlc_state, (expected, _) in EXPECTED_STATES.items():
+            with self.subTest(state=libvlc_state):
+                player = self.new_player(libvlc_state)
+                player._sync_state()
+                self.assertEqual(player._state, expected)
+
+    @patch.object(baseplayer, "Verbose", autospec=True)
+    def test_info_sets_the_player_state_of_each_libvlc_state(self, mocked_verbose):
+        for libvlc_state, (_, expected) in EXPECTED_STATES.items():
+            with self.subTest(state=libvlc_state):
+                player = self.new_player(libvlc_state)
+                player.info
+                self.assertEqual(player._state, expected)
@@ -200,6 +200,22 @@ class TestMedia(BaseMediaTest):
         self.media.play(1, demo=True)
         self.assertEqual(self.media.song, self.song_list[0])
 
+    @patch.object(media.File, "write_to_file", wraps=File.write_to_file)
+    def test_replaying_same_song_only_rewrites_track_when_temp_file_was_removed(self, mocked_write_file):
+        temp_file = self.media._Media__temp_file.name
+        self.media._written_track = None
+        with patch.object(self.media, "player"):
+            # same track, no rewrite
+            self.media.play(1)
+            self.media.play(1)
+            self.assertEqual(mocked_write_file.call_count, 1)
+
+            # temp file removed (e.g. by another Media on startup), rewrite
+            os.remove(temp_file)
+            self.media.play(1)
+            self.assertEqual(mocked_write_file.call_count, 2)
+            self.assertTrue(os.path.isfile(temp_file))
+
     @patch.object(media.Media, "_write_audio", autospec=True)
     @patch.object(media, "Verbose", autospec=True)
     def test_media_get_audio_track_method_raises_property_exception(self, mocked_verbose, mocked_write):
@@ -52,9 +52,9 @@ class TestAlbum(BaseTest):
         self.assertIsNotNone(album.name)
         self.assertEqual(album.name, "Test Album Name")
 
-    @patch.object(mediasetup.re, "search", autospec=True)
+    @patch.object(mediasetup, "_ALBUM_TITLE_RE")
     def test_datpiff_player_version_raise_MP3_Error_when_album_name_is_not_be_found(self, mocked_re):
-        mocked_re.side_effect = AttributeError("invalid regex")
+        mocked_re.search.side_effect = AttributeError("invalid regex")
         with self.assertRaises(Mp3Error):
             album = Album(link=self.mixtape_links[0])
             album._verify_version()
@@ -96,6 +96,19 @@ class TestAlbum(BaseTest):
         # album response content from  album link
         self.assertEqual(self.album._album_html, self.media_request_content)
 
+    def test_album_caches_embedded_player_content_and_album_html(self):
+        # embedded player content is requested once while verifying the album's version
+        album = Album(link=self.mixtape_links[0])
+        self.method.reset_mock()
+
+        album.embedded_player_content
+        album.bio
+        self.method.assert_not_called()
+
+        album._album_html
+        album.uploader
+        self.assertEqual(self.method.call_count, 1)
+
     @patch.object(mediasetup.Mp3, "songs", new_callable=PropertyMock)
     def test_lookup_song_method_return_correct_song(self, mocked_songs):
         # test lookup song method returns correct song
@@ -111,6 +111,15 @@ class TestFileClass(TestCase):
         with open(file_name, "rb") as f:
             self.assertEqual(f.read(), file_content)
 
+    @tmp_wrapper
+    @patch.object(File, "_WRITE_CHUNK_SIZE", 4)
+    def test_write_to_file_method_write_content_larger_than_chunk_size_correctly(self, temp_file=None):
+        file_content = b"some-mp3-content"
+
+        File.write_to_file(filename=temp_file, content=file_content)
+        with open(temp_file, "rb") as f:
+            self.assertEqual(f.read(), file_content)
+
     def test_file_human_readable_file__method_returns_correct_file_size(self):
         self.assertEqual(File.get_human_readable_file_size(0), "0B")
         self.assertEqual(File.get_human_readable_file_size(1), "1B")